@@ -35,6 +35,8 @@ def create_app(config: AppConfig | None = None) -> Flask:
     )
 
     rpi_info = RPiSystemInfo(logger=logger)
+    # The first page render reads every static property, collect them concurrently up front
+    rpi_info.prefetch()
 
     routes.register(app, rpi_info, cache, logger, config)
     error_handlers.register(app, logger, config)
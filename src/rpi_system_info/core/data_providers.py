@@ -9,11 +9,11 @@ from datetime import datetime
 from typing import Any
 
 from ..config import AppConfig
-from .system_info import RPiSystemInfo
+from .system_info import RamInfo, RPiSystemInfo
 from .utils.helpers import format_datetime
 
 
-def get_generic_data(rpi_info: RPiSystemInfo, config: AppConfig) -> dict[str, dict[str, Any]]:
+def get_generic_data(rpi_info: RPiSystemInfo, config: AppConfig) -> dict[str, Any]:
     """
     Return all data needed for the "Generic" tab.
 
@@ -30,7 +30,7 @@ def get_generic_data(rpi_info: RPiSystemInfo, config: AppConfig) -> dict[str, di
               manufacturer, OS, hostname, system time, boot time, uptime,
               internet connectivity status, and public IP.
             - 'cpu_details': dict as returned by get_cpu_data().
-            - 'ram_details': dict as returned by get_ram_data().
+            - 'ram_details': RamInfo as returned by get_ram_data().
     """
     system_time = datetime.now()
     system_time_str = format_datetime(system_time, config.TEXT_DATETIME_FORMAT)
@@ -124,7 +124,7 @@ def get_cpu_data(rpi_info: RPiSystemInfo, config: AppConfig) -> dict[str, dict[s
     }
 
 
-def get_ram_data(rpi_info: RPiSystemInfo) -> dict[str, dict[str, str]]:
+def get_ram_data(rpi_info: RPiSystemInfo) -> dict[str, RamInfo]:
     """
     Retrieve current RAM usage information.
 
@@ -132,11 +132,13 @@ def get_ram_data(rpi_info: RPiSystemInfo) -> dict[str, dict[str, str]]:
         rpi_info: An instance of RPiSystemInfo.
 
     Returns:
-        A dictionary with a single key 'ram_details' containing:
-            - total (str): Total RAM in MB.
-            - used (str): Used RAM in MB.
-            - free (str): Free RAM in MB.
-            - percent (str): Used percentage (as a string).
+        A dictionary with a single key 'ram_details' containing RamInfo with:
+            - total (int): Total RAM in MB.
+            - used (int): Used RAM in MB.
+            - free (int): Free RAM in MB.
+            - cache (int): Buffers and page cache in MB.
+            - available (int): Available RAM in MB.
+            - size (int): Board memory size in MB.
     """
     return {
         'ram_details': rpi_info.get_ram_info()
@@ -1,19 +1,24 @@
+import fcntl
 import http.client
 import logging
 import os
-import re
+import platform
+import pwd
+import socket
+import struct
 import subprocess
 import time
-import urllib.error
-import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from functools import cached_property
+from functools import cache, cached_property
 from string import hexdigits
-from typing import Any, Literal
+from typing import Any, Literal, NamedTuple
 
 from .utils.cls_utils import Singleton
+from .utils.helpers import periodic_ticks, ttl_cache
 from .utils.log_utils import LoggerSingleton
 
 
@@ -50,6 +55,124 @@ class ModelType(Enum):
     RPI_CM0 = 0x1B
 
 
+class RevisionInfo(NamedTuple):
+    """Hardware information decoded from a board revision code."""
+    model_type: ModelType
+    revision: str
+    memory_size: int
+    cpu_model: str
+    manufacturer: str
+    overvoltage_allowed: bool = False
+    otp_programming_allowed: bool = False
+    otp_reading_allowed: bool = False
+
+
+class RamInfo(NamedTuple):
+    """RAM volumes in the requested unit, size is the board memory size in megabytes."""
+    total: int = 0
+    used: int = 0
+    free: int = 0
+    cache: int = 0
+    available: int = 0
+    size: int = 0
+
+
+# Revision code decoding tables
+# Old boards are decoded into ready RevisionInfo values, so a lookup needs no unpacking
+_OLD_BOARDS_REVISIONS: dict[int, RevisionInfo] = {
+    0x0000: RevisionInfo(ModelType.UNKNOWN, "0.0", 0, "UNKNOWN", "UNKNOWN"),
+    0x0002: RevisionInfo(ModelType.RPI_B, "1.0", 256, "BCM2835", "EGOMAN"),
+    0x0003: RevisionInfo(ModelType.RPI_B, "1.0", 256, "BCM2835", "EGOMAN"),
+    0x0004: RevisionInfo(ModelType.RPI_B, "2.0", 256, "BCM2835", "SONY_UK"),
+    0x0005: RevisionInfo(ModelType.RPI_B, "2.0", 256, "BCM2835", "QISDA"),
+    0x0006: RevisionInfo(ModelType.RPI_B, "2.0", 256, "BCM2835", "EGOMAN"),
+    0x0007: RevisionInfo(ModelType.RPI_A, "2.0", 256, "BCM2835", "EGOMAN"),
+    0x0008: RevisionInfo(ModelType.RPI_A, "2.0", 256, "BCM2835", "SONY_UK"),
+    0x0009: RevisionInfo(ModelType.RPI_A, "2.0", 256, "BCM2835", "QISDA"),
+    0x000D: RevisionInfo(ModelType.RPI_B, "2.0", 512, "BCM2835", "EGOMAN"),
+    0x000E: RevisionInfo(ModelType.RPI_B, "2.0", 512, "BCM2835", "SONY_UK"),
+    0x000F: RevisionInfo(ModelType.RPI_B, "2.0", 512, "BCM2835", "EGOMAN"),
+    0x0010: RevisionInfo(ModelType.RPI_B_PLUS, "1.2", 512, "BCM2835", "SONY_UK"),
+    0x0011: RevisionInfo(ModelType.RPI_CM1, "1.0", 512, "BCM2835", "SONY_UK"),
+    0x0012: RevisionInfo(ModelType.RPI_A_PLUS, "1.1", 256, "BCM2835", "SONY_UK"),
+    0x0013: RevisionInfo(ModelType.RPI_B_PLUS, "1.2", 512, "BCM2835", "EMBEST"),
+    0x0014: RevisionInfo(ModelType.RPI_CM1, "1.0", 512, "BCM2835", "EMBEST"),
+    0x0015: RevisionInfo(ModelType.RPI_A_PLUS, "1.1", 512, "BCM2835", "EMBEST"),
+}
+# Reported for every decoded field when the revision code cannot be decoded
+_UNKNOWN_REVISION = _OLD_BOARDS_REVISIONS[0x0000]
+_MEMORY_SIZES = (256, 512, 1024, 2048, 4096, 8192, 16384)
+_CPU_MODELS = ("BCM2835", "BCM2836", "BCM2837", "BCM2711", "BCM2712")
+_MANUFACTURERS = ("Sony UK", "Egoman", "Embest", "Sony Japan", "Embest", "Stadium")
+
+_FREQUENCY_DIVISORS = {'Hz': 1, 'KHz': 1_000, 'MHz': 1_000_000, 'GHz': 1_000_000_000}
+
+# Units of the 'uptime -p' format: name, length in seconds and how many of them make up the next unit
+_UPTIME_UNITS = (
+    ('decade', 10 * 365 * 86400, None),
+    ('year', 365 * 86400, 10),
+    ('week', 7 * 86400, 52),
+    ('day', 86400, 7),
+    ('hour', 3600, 24),
+    ('minute', 60, 60),
+)
+
+# Units of /proc/<pid>/stat times and resident set size
+_CLK_TCK = os.sysconf('SC_CLK_TCK')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# The /proc/stat sample of the previous CPU usage call is reused for at most this many sampling intervals
+_CPU_SAMPLE_MAX_AGE_INTERVALS = 5
+
+# Bits of the 'vcgencmd get_throttled' value: flag name, mask and description of the active condition
+_THROTTLE_BITS: tuple[tuple[str, int, str | None], ...] = (
+    ('under_voltage', 0x1, 'Undervoltage detected'),
+    ('arm_frequency_capped', 0x2, 'Arm frequency capped'),
+    ('currently_throttled', 0x4, 'Currently throttled'),
+    ('soft_temperature_limit', 0x8, 'Soft temperature limit active'),
+    ('under_voltage_occurred', 0x10000, None),
+    ('arm_frequency_capped_occurred', 0x20000, None),
+    ('throttling_occurred', 0x40000, None),
+    ('soft_temperature_limit_occurred', 0x80000, None),
+)
+
+# /proc/meminfo fields that change at runtime and are needed for RAM info, MemTotal is read once
+_MEMINFO_KEYS = frozenset(('MemFree', 'MemAvailable', 'Buffers', 'Cached', 'SReclaimable'))
+_RAM_UNIT_DIVISORS = {'b': 1, 'k': 1 << 10, 'm': 1 << 20, 'g': 1 << 30}
+
+# ioctl requests for IPv4 interface addresses, from <linux/sockios.h>
+_SIOCGIFADDR = 0x8915
+_SIOCGIFBRDADDR = 0x8919
+_SIOCGIFNETMASK = 0x891B
+
+# VideoCore mailbox property interface used by vcgencmd, see raspberrypi/utils
+_VCIO_PATH = "/dev/vcio"
+# _IOWR(100, 0, char *)
+_IOCTL_MBOX_PROPERTY = (3 << 30) | (struct.calcsize('P') << 16) | (100 << 8)
+_MBOX_TAG_GET_GENCMD_RESULT = 0x00030080
+_MBOX_RESPONSE_SUCCESS = 0x80000000
+_GENCMD_MAX_STRING = 1024
+# Header of 6 words (size, code, tag, value buffer size, value length, error), string and the end tag
+_GENCMD_BUFFER_SIZE = 6 * 4 + _GENCMD_MAX_STRING + 4
+
+
+def _split_nmcli_terse(line: str) -> list[str]:
+    """Splits a line of `nmcli -t` output into fields, undoing the escaping of ':' and '\\'."""
+    fields: list[str] = []
+    current: list[str] = []
+    chars = iter(line)
+    for char in chars:
+        if char == '\\':
+            current.append(next(chars, ''))
+        elif char == ':':
+            fields.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    fields.append(''.join(current))
+    return fields
+
+
 class IncorrectFrequencyUnitError(Exception):
     """Raise when frequency unit not in ['Hz', 'KHz', 'MHz', 'GHz']"""
 
@@ -57,51 +180,121 @@ class IncorrectFrequencyUnitError(Exception):
 @dataclass(frozen=True)
 class RPiSystemInfo(metaclass=Singleton):
     _NET_PATH = "/sys/class/net"
+    _THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+    _BLUETOOTH_PATH = "/sys/class/bluetooth"
     logger: logging.Logger = field(repr=False)
-    revision_code: str = field(init=False)
-    revision: str = field(init=False)
-    model_type: ModelType = field(init=False)
-    manufacturer: str = field(init=False)
-    cpu_model: str = field(init=False)
-    memory_size: int = field(init=False)
-    overvoltage_allowed: bool = field(init=False, default=False)
-    otp_programming_allowed: bool = field(init=False, default=False)
-    otp_reading_allowed: bool = field(init=False, default=False)
+    # Descriptors of the polled /proc and /sys files, kept open between reads
+    _polled_fds: dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
+    # Found Bluetooth controller MAC addresses by interface name
+    _bluetooth_mac_addresses: dict[str, str] = field(init=False, repr=False, compare=False, default_factory=dict)
+    # Monotonic time, total and idle CPU times of the latest successful /proc/stat sample
+    _cpu_times_sample: deque[tuple[float, int, int]] = field(
+        init=False, repr=False, compare=False, default_factory=lambda: deque(maxlen=1))
     FrequencyUnit = Literal['Hz', 'KHz', 'MHz', 'GHz']
 
     def __post_init__(self) -> None:
-        """Initialize Raspberry Pi hardware information.
+        """Creates the instance without touching the hardware.
 
-        Raises:
-            ValueError: if revision code is invalid
-            RuntimeError: if hardware info cannot be decoded
-        """
-        self.logger.debug("Fetching board revision code...")
-        command = "cat /proc/cpuinfo | grep 'Revision' | cut -d: -f2"
-        fetched_revision_code = self.__get_shell_cmd_output(command)
-        self.logger.debug(f"Board revision code: {fetched_revision_code}")
-        object.__setattr__(self, 'revision_code', fetched_revision_code)
+        Board information is read and decoded on first access of the corresponding property,
+        call `prefetch` to collect all static information up front.
+        """
+        self.logger.debug("RPiSystemInfo created, hardware information will be read on demand")
+
+    @cached_property
+    def _cpuinfo(self) -> dict[str, str]:
+        """Parses /proc/cpuinfo once into a dict.
+
+        Returns:
+            Dict of cpuinfo fields, it does not change while the system is running.
+        """
+        cpuinfo = {}
+        for line in self.__read_file("/proc/cpuinfo").splitlines():
+            key, sep, value = line.partition(':')
+            if sep:
+                cpuinfo[key.strip()] = value.strip()
+        return cpuinfo
+
+    @cached_property
+    def revision_code(self) -> str:
+        """Retrieves the board revision code from /proc/cpuinfo.
+
+        Returns:
+            The revision code as a hex string, or empty string if it is not available.
+        """
+        return self._cpuinfo.get('Revision', '')
+
+    @cached_property
+    def _revision_info(self) -> RevisionInfo | None:
+        """Decodes the board revision code on first access.
+
+        The outcome is cached either way, so a code that cannot be decoded is reported only once.
+
+        Returns:
+            The decoded hardware information, or None if the revision code cannot be decoded.
+        """
+        revision_code = self.revision_code
+        self.logger.debug("Board revision code: %s", revision_code)
         try:
-            decoded_data = RPiSystemInfo.decode_revision_code(fetched_revision_code)
-            self.logger.debug(f"Successfully decoded revision code: {fetched_revision_code}")
-            object.__setattr__(self, 'model_type', decoded_data['model_type'])
-            object.__setattr__(self, 'revision', decoded_data['revision'])
-            object.__setattr__(self, 'manufacturer', decoded_data['manufacturer'])
-            object.__setattr__(self, 'cpu_model', decoded_data['cpu_model'])
-            object.__setattr__(self, 'memory_size', decoded_data['memory_size'])
-            if 'overvoltage_allowed' in decoded_data:
-                object.__setattr__(self, 'overvoltage_allowed', decoded_data['overvoltage_allowed'])
-            if 'otp_programming_allowed' in decoded_data:
-                object.__setattr__(self, 'otp_programming_allowed', decoded_data['otp_programming_allowed'])
-            if 'otp_reading_allowed' in decoded_data:
-                object.__setattr__(self, 'otp_reading_allowed', decoded_data['otp_reading_allowed'])
-            self.logger.info("RPiSystemInfo info fully initialized")
+            revision_info = RPiSystemInfo.decode_revision_code(revision_code)
+            self.logger.debug("Successfully decoded revision code: %s", revision_code)
+            return revision_info
         except (ValueError, TypeError) as e:
-            self.logger.error(f"Invalid revision code '{fetched_revision_code}': {e}")
-            raise ValueError(f"Cannot initialize with revision code '{fetched_revision_code}': {e}") from e
-        except Exception as e:
-            self.logger.exception("Failed to initialize RPiSystemInfo")
-            raise RuntimeError(f"RPiSystemInfo initialization failed: {e}") from e
+            self.logger.error("Invalid revision code '%s': %s", revision_code, e)
+        except Exception:
+            self.logger.exception("Failed to decode board revision code '%s'", revision_code)
+        return None
+
+    @cached_property
+    def model_type(self) -> ModelType:
+        """The board model type decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).model_type
+
+    @cached_property
+    def revision(self) -> str:
+        """The board revision decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).revision
+
+    @cached_property
+    def memory_size(self) -> int:
+        """The board memory size in megabytes decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).memory_size
+
+    @cached_property
+    def cpu_model(self) -> str:
+        """The CPU model decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).cpu_model
+
+    @cached_property
+    def manufacturer(self) -> str:
+        """The board manufacturer decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).manufacturer
+
+    @cached_property
+    def overvoltage_allowed(self) -> bool:
+        """Whether overvoltage is allowed, decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).overvoltage_allowed
+
+    @cached_property
+    def otp_programming_allowed(self) -> bool:
+        """Whether OTP programming is allowed, decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).otp_programming_allowed
+
+    @cached_property
+    def otp_reading_allowed(self) -> bool:
+        """Whether OTP reading is allowed, decoded from the revision code."""
+        return (self._revision_info or _UNKNOWN_REVISION).otp_reading_allowed
+
+    def prefetch(self) -> None:
+        """Populates the cached static properties concurrently.
+
+        The properties are independent of each other and mostly wait on file reads and
+        subprocesses, so fetching them in parallel takes about as long as the slowest one.
+        """
+        names = ('_revision_info', 'model_name', '_lscpu', '_os_release', 'hostname', 'boot_time', 'cpu_cores_count')
+        with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix='prefetch') as executor:
+            for name, future in [(name, executor.submit(getattr, self, name)) for name in names]:
+                if (e := future.exception()) is not None:
+                    self.logger.error("Failed to prefetch %s: %s", name, e)
 
     def __str__(self) -> str:
         return (f"Model type: {self.model_type.name}, "
@@ -113,7 +306,8 @@ class RPiSystemInfo(metaclass=Singleton):
                 f"Memory size: {self.memory_size}Mb")
 
     @staticmethod
-    def decode_revision_code(revision_code: str) -> dict[str, Any]:
+    @cache
+    def decode_revision_code(revision_code: str) -> RevisionInfo:
         """Decode Raspberry Pi revision code into hardware information.
 
         Parses hexadecimal revision code and extracts model type, revision,
@@ -124,7 +318,7 @@ class RPiSystemInfo(metaclass=Singleton):
             revision_code: Hexadecimal string representing the revision code
 
         Returns:
-            Dictionary containing decoded hardware information
+            RevisionInfo tuple containing decoded hardware information, results are memoized per code
 
         Raises:
             ValueError: If revision code is invalid or cannot be decoded
@@ -137,30 +331,6 @@ class RPiSystemInfo(metaclass=Singleton):
         if not revision_code.startswith(('0x', '0X')) and not all(c in hexdigits for c in revision_code):
             raise ValueError(f"Invalid revision code format: '{revision_code}'. Expected hex string")
 
-        old_boards_revisions_decoder = {
-            0x0000: (ModelType.UNKNOWN, "0.0", 0, "UNKNOWN", "UNKNOWN"),
-            0x0002: (ModelType.RPI_B, "1.0", 256, "BCM2835", "EGOMAN"),
-            0x0003: (ModelType.RPI_B, "1.0", 256, "BCM2835", "EGOMAN"),
-            0x0004: (ModelType.RPI_B, "2.0", 256, "BCM2835", "SONY_UK"),
-            0x0005: (ModelType.RPI_B, "2.0", 256, "BCM2835", "QISDA"),
-            0x0006: (ModelType.RPI_B, "2.0", 256, "BCM2835", "EGOMAN"),
-            0x0007: (ModelType.RPI_A, "2.0", 256, "BCM2835", "EGOMAN"),
-            0x0008: (ModelType.RPI_A, "2.0", 256, "BCM2835", "SONY_UK"),
-            0x0009: (ModelType.RPI_A, "2.0", 256, "BCM2835", "QISDA"),
-            0x000D: (ModelType.RPI_B, "2.0", 512, "BCM2835", "EGOMAN"),
-            0x000E: (ModelType.RPI_B, "2.0", 512, "BCM2835", "SONY_UK"),
-            0x000F: (ModelType.RPI_B, "2.0", 512, "BCM2835", "EGOMAN"),
-            0x0010: (ModelType.RPI_B_PLUS, "1.2", 512, "BCM2835", "SONY_UK"),
-            0x0011: (ModelType.RPI_CM1, "1.0", 512, "BCM2835", "SONY_UK"),
-            0x0012: (ModelType.RPI_A_PLUS, "1.1", 256, "BCM2835", "SONY_UK"),
-            0x0013: (ModelType.RPI_B_PLUS, "1.2", 512, "BCM2835", "EMBEST"),
-            0x0014: (ModelType.RPI_CM1, "1.0", 512, "BCM2835", "EMBEST"),
-            0x0015: (ModelType.RPI_A_PLUS, "1.1", 512, "BCM2835", "EMBEST"),
-        }
-        memory_sizes = [256, 512, 1024, 2048, 4096, 8192, 16384]
-        cpu_models = ["BCM2835", "BCM2836", "BCM2837", "BCM2711", "BCM2712"]
-        manufacturers = ["Sony UK", "Egoman", "Embest", "Sony Japan", "Embest", "Stadium"]
-
         try:
             code = int(revision_code, 16)
         except ValueError as e:
@@ -174,34 +344,27 @@ class RPiSystemInfo(metaclass=Singleton):
                 memory_index = (code & 0x700000) >> 20
                 cpu_index = (code & 0xF000) >> 12
                 manufacturer_index = (code & 0xF0000) >> 16
-                if memory_index >= len(memory_sizes):
+                if memory_index >= len(_MEMORY_SIZES):
                     raise ValueError(f"Invalid memory size index: {memory_index}")
-                if cpu_index >= len(cpu_models):
+                if cpu_index >= len(_CPU_MODELS):
                     raise ValueError(f"Invalid CPU model index: {cpu_index}")
-                if manufacturer_index >= len(manufacturers):
+                if manufacturer_index >= len(_MANUFACTURERS):
                     raise ValueError(f"Invalid manufacturer index: {manufacturer_index}")
-                return {
-                    'model_type': ModelType((code & 0xFF0) >> 4),
-                    'revision': f"1.{code & 0xF}",
-                    'memory_size': memory_sizes[memory_index],
-                    'cpu_model': cpu_models[cpu_index],
-                    'manufacturer': manufacturers[manufacturer_index],
-                    'overvoltage_allowed': bool((code & 0x80000000) >> 31),
-                    'otp_programming_allowed': bool((code & 0x40000000) >> 30),
-                    'otp_reading_allowed': bool((code & 0x20000000) >> 29),
-                }
+                return RevisionInfo(
+                    ModelType((code & 0xFF0) >> 4),
+                    f"1.{code & 0xF}",
+                    _MEMORY_SIZES[memory_index],
+                    _CPU_MODELS[cpu_index],
+                    _MANUFACTURERS[manufacturer_index],
+                    bool(code & 0x80000000),
+                    bool(code & 0x40000000),
+                    bool(code & 0x20000000),
+                )
             else:
                 # Old style revision code decoding
-                if code not in old_boards_revisions_decoder:
+                if code not in _OLD_BOARDS_REVISIONS:
                     raise ValueError(f"Unknown old board revision code: 0x{code:04X}")
-                board_data = old_boards_revisions_decoder[code]
-                return {
-                    'model_type': board_data[0],
-                    'revision': board_data[1],
-                    'memory_size': board_data[2],
-                    'cpu_model': board_data[3],
-                    'manufacturer': board_data[4],
-                }
+                return _OLD_BOARDS_REVISIONS[code]
         except (IndexError, ValueError) as e:
             raise ValueError(f"Failed to decode revision code 0x{code:08X}: {e}") from e
         except Exception as e:
@@ -224,94 +387,162 @@ class RPiSystemInfo(metaclass=Singleton):
     @staticmethod
     def convert_frequency(frequency: float, unit: FrequencyUnit = 'MHz') -> float | int:
         """Converts input frequency value from Hz to specified unit."""
-        result = 0.0
-        match unit:
-            case 'Hz':
-                result = frequency
-            case 'KHz':
-                result = frequency / 10**3
-            case 'MHz':
-                result = frequency / 10**6
-            case 'GHz':
-                result = frequency / 10**9
-            case _:
-                raise IncorrectFrequencyUnitError(f"Requested unknown CPU frequency unit: {unit}")
-        return RPiSystemInfo.float_to_int_if_zero_fraction(result)
-
-    def __get_shell_cmd_output(self, command: str) -> str:
-        """Executes a shell command and returns its standard output.
-
-        This method runs the provided shell command using `subprocess.run`.
-        It captures the standard output and standard error, and checks for
-        execution errors. If the command is successful, the stripped standard
-        output is returned. If the command fails (either due to a non-zero
-        exit code or command not being found), an error is logged using the
-        logger and `None` is returned.
-
-        *Warning*: `shell=True` is used to execute the command with pipes.
-        This can be a security risk if the `command` string is constructed
-        from untrusted input, as it can lead to shell injection vulnerabilities.
+        try:
+            divisor = _FREQUENCY_DIVISORS[unit]
+        except KeyError:
+            raise IncorrectFrequencyUnitError(f"Requested unknown CPU frequency unit: {unit}") from None
+        return RPiSystemInfo.float_to_int_if_zero_fraction(frequency / divisor)
+
+    def __get_cmd_output(self, args: list[str]) -> str:
+        """Executes a command directly, without a shell, and returns its standard output.
 
         Args:
-            command: The shell command to execute as a string.
+            args: The program to run followed by its arguments.
 
         Returns:
             The stripped standard output of the command as a string if the
             command executes successfully or empty string if the command fails.
         """
         try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, check=True)
+            result = subprocess.run(args, capture_output=True, text=True, check=True)
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Shell command '{command}' failed (code {e.returncode}): {e.stderr.strip()}")
+            self.logger.error("Command '%s' failed (code %s): %s", " ".join(args), e.returncode, e.stderr.strip())
         except FileNotFoundError:
-            self.logger.error(f"Command not found: {command}")
+            self.logger.error("Command not found: %s", args[0])
+        return ''
+
+    def __read_file(self, path: str) -> str:
+        """Reads a text file and returns its content.
+
+        Args:
+            path: The path of the file to read.
+
+        Returns:
+            The stripped content of the file, or empty string if the file cannot be read.
+        """
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError as e:
+            self.logger.error("Failed to read file %s: %s", path, e)
         return ''
 
+    def __read_polled_file(self, path: str) -> str:
+        """Reads a frequently polled /proc or /sys file through a descriptor that stays open.
+
+        The kernel regenerates these files on every read from offset 0, so reading them
+        with pread on a persistent descriptor saves an open and a close on each poll.
+
+        Args:
+            path: The path of the file to read.
+
+        Returns:
+            The stripped content of the file, or empty string if the file cannot be read.
+        """
+        fd = self._polled_fds.get(path)
+        try:
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+                # Another thread may have opened the same file in the meantime
+                if (known_fd := self._polled_fds.setdefault(path, fd)) != fd:
+                    os.close(fd)
+                    fd = known_fd
+            chunks = []
+            offset = 0
+            while chunk := os.pread(fd, 4096, offset):
+                chunks.append(chunk)
+                offset += len(chunk)
+            return b''.join(chunks).decode().strip()
+        except OSError as e:
+            self.logger.error("Failed to read file %s: %s", path, e)
+        return ''
+
+    def __get_vcgencmd_output(self, command: str) -> str:
+        """Runs a VideoCore general command and returns its output, like 'vcgencmd <command>' does.
+
+        The command is passed to the firmware through the /dev/vcio mailbox with a single ioctl,
+        the vcgencmd tool is only started when the mailbox is not accessible.
+
+        Args:
+            command: The command with its arguments, for example "measure_volts core".
+
+        Returns:
+            The stripped command output, or empty string if the command fails.
+        """
+        if len(command) >= _GENCMD_MAX_STRING:
+            self.logger.error("VideoCore command is too long: %s", command)
+            return ''
+        buffer = bytearray(_GENCMD_BUFFER_SIZE)
+        struct.pack_into('6I', buffer, 0, _GENCMD_BUFFER_SIZE, 0, _MBOX_TAG_GET_GENCMD_RESULT, _GENCMD_MAX_STRING, 0, 0)
+        buffer[24:24 + len(command)] = command.encode()
+        try:
+            fd = os.open(_VCIO_PATH, os.O_RDWR | os.O_CLOEXEC)
+            try:
+                fcntl.ioctl(fd, _IOCTL_MBOX_PROPERTY, buffer)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.debug("VideoCore mailbox is not available (%s), running vcgencmd", e)
+            return self.__get_cmd_output(["vcgencmd", *command.split()])
+        response_code, = struct.unpack_from('I', buffer, 4)
+        error, = struct.unpack_from('I', buffer, 20)
+        if response_code != _MBOX_RESPONSE_SUCCESS or error:
+            self.logger.error("VideoCore command '%s' failed (response 0x%08X, error %s)",
+                              command, response_code, error)
+            return ''
+        return buffer[24:24 + _GENCMD_MAX_STRING].partition(b'\0')[0].decode(errors='replace').strip()
+
     @cached_property
     def model_name(self) -> str:
         """Retrieves the board model name from /sys/firmware/devicetree/base/model.
 
         Returns:
-            The board model name, or empty string if the command fails or the file is not found.
+            The board model name, or empty string if the file is not found.
         """
-        command = "cat /sys/firmware/devicetree/base/model"
-        return self.__get_shell_cmd_output(command)
+        # Device tree strings are NUL-terminated
+        return self.__read_file("/sys/firmware/devicetree/base/model").rstrip('\x00')
 
     @cached_property
     def serial_number(self) -> str:
         """Retrieves the board serial number from /proc/cpuinfo.
 
         Returns:
-            The board serial number, or empty string if the command fails.
+            The board serial number, or empty string if it is not available.
+        """
+        return self._cpuinfo.get('Serial', '')
+
+    @cached_property
+    def _lscpu(self) -> dict[str, str]:
+        """Runs the 'lscpu' command once and parses its output into a dict.
+
+        Returns:
+            Dict of lscpu fields, empty if the command fails.
         """
-        command = "cat /proc/cpuinfo | grep 'Serial' | cut -d: -f2"
-        return self.__get_shell_cmd_output(command)
+        lscpu = {}
+        for line in self.__get_cmd_output(["lscpu"]).splitlines():
+            key, sep, value = line.partition(':')
+            if sep:
+                lscpu[key.strip()] = value.strip()
+        return lscpu
 
     @cached_property
     def cpu_architecture(self) -> str:
-        """Retrieves the CPU architecture using the 'lscpu' command.
+        """Retrieves the CPU architecture, the machine name reported by the kernel like in 'lscpu'.
 
         Returns:
-            The CPU architecture, or empty string if the command fails.
+            The CPU architecture, or empty string if it cannot be determined.
         """
-        command = "lscpu | grep 'Architecture' | cut -d: -f2"
-        return self.__get_shell_cmd_output(command)
+        return platform.machine()
 
     @cached_property
     def cpu_cores_count(self) -> int:
-        """Retrieves the number of CPU cores using the 'nproc' command.
+        """Retrieves the number of CPU cores available to this process.
 
         Returns:
-            The number of CPU cores, or 0 if the command fails.
+            The number of CPU cores.
         """
-        command = "nproc"
-        result = self.__get_shell_cmd_output(command)
-        try:
-            return int(result)
-        except ValueError:
-            self.logger.error(f"Error while converting number of cores value '{result}' to int")
-        return 0
+        return len(os.sched_getaffinity(0))
 
     @cached_property
     def cpu_cache_sizes(self) -> dict[str, str]:
@@ -321,96 +552,126 @@ class RPiSystemInfo(metaclass=Singleton):
             A dictionary {L1d: size, L1i: size, L2: size}, where size is a string
             representing value in KiB, or empty string if command fails.
         """
-        command = "lscpu"
-        output = self.__get_shell_cmd_output(command)
-        cache_types = ["L1d", "L1i", "L2"]
-        cache_sizes = dict.fromkeys(cache_types, "")
-        if output:
-            lines = output.splitlines()
-            for line in lines:
-                for cache in cache_types:
-                    match = re.match(fr"{cache} cache:\s*(\S+)", line)
-                    if match:
-                        cache_sizes[cache] = match.group(1)
-                        continue
+        cache_sizes = {}
+        for name in ("L1d", "L1i", "L2"):
+            # Values look like "128 KiB (4 instances)"
+            size = self._lscpu.get(f"{name} cache", "").split(maxsplit=1)
+            cache_sizes[name] = size[0] if size else ''
         return cache_sizes
 
     @cached_property
     def hostname(self) -> str:
-        """Retrieves the hostname using the 'hostname' command.
+        """Retrieves the hostname of the system.
+
+        Returns:
+            The hostname.
+        """
+        return socket.gethostname()
+
+    @cached_property
+    def _os_release(self) -> dict[str, str]:
+        """Parses /etc/os-release once into a dict.
 
         Returns:
-            The hostname, or empty string if the command fails.
+            Dict of os-release variables with surrounding quotes removed from values.
         """
-        command = "hostname"
-        return self.__get_shell_cmd_output(command)
+        os_release = {}
+        for line in self.__read_file("/etc/os-release").splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                os_release[key] = value.strip('"')
+        return os_release
 
     @cached_property
     def os_name(self) -> str:
-        """Retrieves the pretty OS name from /etc/*-release.
+        """Retrieves the pretty OS name from /etc/os-release.
 
         Returns:
-            The pretty OS name, or empty string if the command fails. Removes surrounding quotes.
+            The pretty OS name, or empty string if it is not available.
         """
-        command = "cat /etc/*-release | grep PRETTY_NAME | cut -d= -f2"
-        return self.__get_shell_cmd_output(command).strip('"')
+        return self._os_release.get('PRETTY_NAME', '')
 
     @cached_property
     def boot_time(self) -> datetime | None:
         """Retrieves the time of boot from which uptime is calculated.
 
         Returns:
-            The datetime of boot or None if the command fails.
+            The datetime of boot or None if it cannot be read from /proc/stat.
         """
-        command = "uptime -s"
-        uptime_str = self.__get_shell_cmd_output(command)
-        if uptime_str:
-            return datetime.strptime(uptime_str, "%Y-%m-%d %H:%M:%S")
-        else:
-            return None
+        # The kernel keeps the boot time as a Unix timestamp in the "btime" line of /proc/stat
+        for line in self.__read_file("/proc/stat").splitlines():
+            if line.startswith('btime '):
+                try:
+                    return datetime.fromtimestamp(int(line[len('btime '):]))
+                except ValueError:
+                    self.logger.error("Error while converting boot time value '%s' to int", line)
+                break
+        return None
 
     def get_uptime_pretty(self) -> str:
-        """Retrieves the system uptime in a human-readable format.
+        """Retrieves the system uptime in the human-readable format of 'uptime -p'.
 
         Returns:
-            The uptime in human-readable format or empty string if the command fails.
+            The uptime like "up 1 week, 2 days, 3 hours, 4 minutes", or empty string if it cannot be read.
         """
-        command = "uptime -p"
-        return self.__get_shell_cmd_output(command)
-
+        uptime = self.__read_polled_file("/proc/uptime").partition(' ')[0]
+        try:
+            seconds = int(float(uptime))
+        except ValueError:
+            self.logger.error("Error while converting uptime value '%s' to float", uptime)
+            return ''
+        parts = []
+        for name, length, limit in _UPTIME_UNITS:
+            count = seconds // length
+            if limit is not None:
+                count %= limit
+            if count:
+                parts.append(f"{count} {name}{'s' if count > 1 else ''}")
+        return f"up {', '.join(parts) or '0 minutes'}"
+
+    @ttl_cache(seconds=1)
     def get_cpu_core_voltage(self) -> float | None:
-        """Retrieves the CPU core voltage using the 'vcgencmd' command.
+        """Retrieves the CPU core voltage from the VideoCore firmware ('vcgencmd measure_volts').
 
         Returns:
             The CPU core voltage, or None if the command fails.
         """
-        command = "vcgencmd measure_volts| cut -d= -f2"
-        result = self.__get_shell_cmd_output(command)
+        # Output looks like "volt=0.8563V"
+        result = self.__get_vcgencmd_output("measure_volts").partition('=')[2]
         try:
-            if result is not None:
-                return float(result[:-1])
+            return float(result[:-1])
         except (IndexError, ValueError):
-            self.logger.error(f"Error while converting CPU voltage value '{result}' to float")
+            self.logger.error("Error while converting CPU voltage value '%s' to float", result)
         return None
 
+    @ttl_cache(seconds=1)
     def get_cpu_temperature(self) -> float | None:
-        """Retrieves the CPU temperature using the 'vcgencmd' command.
+        """Retrieves the CPU temperature from the thermal zone in sysfs.
+        Falls back to the 'vcgencmd' command on systems without the thermal zone.
 
         Returns:
-            The CPU temperature, or None if the command fails.
+            The CPU temperature, or None if it cannot be read.
         """
-        command = "vcgencmd measure_temp | cut -d= -f2 | cut -d\\' -f1"
-        result = self.__get_shell_cmd_output(command)
+        if os.path.exists(self._THERMAL_PATH):
+            # The value is in millidegrees Celsius, like "48312"
+            result = self.__read_polled_file(self._THERMAL_PATH)
+            try:
+                return int(result) / 1000
+            except ValueError:
+                self.logger.error("Error while converting CPU temperature value '%s' to int", result)
+                return None
+        # Output looks like "temp=48.3'C"
+        result = self.__get_vcgencmd_output("measure_temp").partition('=')[2].partition("'")[0]
         try:
-            if result is not None:
-                return float(result)
+            return float(result)
         except ValueError:
-            self.logger.error(f"Error while converting CPU temperature value '{result}' to float")
+            self.logger.error("Error while converting CPU temperature value '%s' to float", result)
         return None
 
+    @ttl_cache(seconds=1)
     def get_cpu_core_frequencies(self, unit: FrequencyUnit = 'MHz') -> dict[str, int | float]:
         """Retrieves min, max and current CPU core frequencies in specified units (Hz, KHz, MHz or GHz).
-        If for some frequency type the command fails, then 0 will return for it.
+        If for some frequency type the sysfs file cannot be read, then 0 will return for it.
 
         Args:
             unit: The desired unit for the core frequency (Hz, KHz, MHz, GHz). Defaults to 'MHz'.
@@ -423,55 +684,133 @@ class RPiSystemInfo(metaclass=Singleton):
             'max': 0.0,
             'cur': 0.0,
         }
+        # All three values share the unit, so the divisor is resolved once
+        divisor = _FREQUENCY_DIVISORS.get(unit)
+        if divisor is None:
+            self.logger.error("Requested unknown CPU frequency unit: %s", unit)
+            return core_frequencies
         for ft in core_frequencies:
-            command = f"cat /sys/devices/system/cpu/cpu0/cpufreq/scaling_{ft}_freq"
-            result = self.__get_shell_cmd_output(command)
+            result = self.__read_polled_file(f"/sys/devices/system/cpu/cpu0/cpufreq/scaling_{ft}_freq")
             if result:
                 try:
+                    # sysfs reports frequencies in KHz
                     frequency = float(result) * 1000
-                    core_frequencies[ft] = RPiSystemInfo.convert_frequency(frequency, unit)
+                    core_frequencies[ft] = RPiSystemInfo.float_to_int_if_zero_fraction(frequency / divisor)
                 except ValueError:
-                    self.logger.error(f"Error while converting CPU frequency value '{result}' to float")
+                    self.logger.error("Error while converting CPU frequency value '%s' to float", result)
                 except Exception as e:
-                    self.logger.error(f"CPU frequency processing error: {e}")
+                    self.logger.error("CPU frequency processing error: %s", e)
         return core_frequencies
 
-    def get_cpu_usage(self) -> str:
-        """Retrieves the CPU usage using the 'top' command.
+    def __read_cpu_times(self) -> tuple[int, int]:
+        """Reads the aggregate CPU times from the first line of /proc/stat.
 
         Returns:
-            The CPU usage, or None if the command fails. Note that the output format is dependent on 'top'.
+            Tuple of total and idle (idle + iowait) CPU time in clock ticks, or (0, 0) if unavailable.
         """
-        command = "top -b -n2 | grep 'Cpu(s)'| tail -n 1 | awk '{print $2 + $4 }'"
-        return self.__get_shell_cmd_output(command)
+        line = self.__read_polled_file("/proc/stat").partition('\n')[0]
+        try:
+            # "cpu  user nice system idle iowait irq softirq steal guest guest_nice",
+            # guest times are already included in user and nice
+            times = [int(value) for value in line.split()[1:9]]
+            return sum(times), times[3] + times[4]
+        except (IndexError, ValueError):
+            self.logger.error("Failed to parse /proc/stat line: %s", line)
+        return 0, 0
 
-    def get_ram_info(self, unit: str = 'm') -> dict[str, str]:
-        """Retrieves RAM info in specified units (b, k, m, g). Uses a safer approach.
+    @ttl_cache(seconds=1)
+    def get_cpu_usage(self, interval: float = 0.5) -> float | None:
+        """Retrieves the CPU usage from /proc/stat samples.
+
+        When the previous call took its sample less than a few intervals ago, as in a polling
+        loop, the usage is measured since that sample and the call returns immediately.
+        Otherwise it takes two samples `interval` seconds apart, so an occasional caller
+        gets the current usage rather than the average since its previous call.
+
+        Args:
+            interval: The sampling interval in seconds. Defaults to 0.5.
 
         Returns:
-            The RAM info dict with total, used, free, cache and available memory volume in passed unit.
+            The CPU usage in percent rounded to one decimal place, or None if it cannot be measured.
         """
-        ram_fields = ['total', 'used', 'free', 'cache', 'available']
-        ram_info = dict.fromkeys(ram_fields, "")
-        ram_info['size'] = str(self.memory_size)
-        if unit not in ['b', 'k', 'm', 'g']:
-            self.logger.error(f"Requested unknown RAM volume unit: {unit}")
-            return ram_info
-        command = f"free -{unit}"
-        output = self.__get_shell_cmd_output(command)
-        if output:
-            try:
-                lines = output.splitlines()
-                fields = lines[1].split()
-                ram_info['total'] = fields[1]
-                ram_info['used'] = fields[2]
-                ram_info['free'] = fields[3]
-                ram_info['cache'] = fields[5]
-                ram_info['available'] = fields[6]
-            except (IndexError, ValueError) as e:
-                self.logger.error(f"Failed to parse 'free' command output: {output} ({e})")
-        return ram_info
+        samples = self._cpu_times_sample
+        if samples and time.monotonic() - samples[0][0] <= _CPU_SAMPLE_MAX_AGE_INTERVALS * interval:
+            _, total_before, idle_before = samples[0]
+        else:
+            total_before, idle_before = self.__read_cpu_times()
+            if not total_before:
+                return None
+            time.sleep(interval)
+        total_after, idle_after = self.__read_cpu_times()
+        if not total_after:
+            return None
+        samples.append((time.monotonic(), total_after, idle_after))
+        total = total_after - total_before
+        if total <= 0:
+            return None
+        return round(100 * (total - (idle_after - idle_before)) / total, 1)
+
+    @cached_property
+    def _mem_total(self) -> int:
+        """Retrieves the total amount of usable RAM in bytes, it does not change at runtime.
 
+        Returns:
+            The MemTotal value of /proc/meminfo in bytes, or 0 if it cannot be read.
+        """
+        # The first line looks like "MemTotal:        3884096 kB"
+        line = self.__read_file("/proc/meminfo").partition('\n')[0]
+        key, _, value = line.partition(':')
+        try:
+            if key == 'MemTotal':
+                return int(value.split()[0]) * 1024
+        except (IndexError, ValueError):
+            pass
+        self.logger.error("Failed to parse MemTotal line of /proc/meminfo: %s", line)
+        return 0
+
+    @ttl_cache(seconds=1)
+    def get_ram_info(self, unit: str = 'm') -> RamInfo:
+        """Retrieves RAM info in specified units (b, k, m, g) from /proc/meminfo.
+
+        The values are computed the same way the 'free' command does: cache is
+        Buffers + Cached + SReclaimable and used is total minus available memory.
+
+        Returns:
+            RamInfo with total, used, free, cache and available memory volume in passed unit,
+            volumes are 0 if they cannot be read.
+        """
+        size = self.memory_size
+        if unit not in _RAM_UNIT_DIVISORS:
+            self.logger.error("Requested unknown RAM volume unit: %s", unit)
+            return RamInfo(size=size)
+        output = self.__read_polled_file("/proc/meminfo")
+        if output and self._mem_total:
+            try:
+                # Lines look like "MemFree:         1467184 kB", only the needed ones are converted
+                meminfo = {}
+                for line in output.splitlines():
+                    key, _, value = line.partition(':')
+                    if key in _MEMINFO_KEYS:
+                        meminfo[key] = int(value.split()[0]) * 1024
+                        if len(meminfo) == len(_MEMINFO_KEYS):
+                            break
+                total = self._mem_total
+                available = meminfo['MemAvailable']
+                cache = meminfo['Buffers'] + meminfo['Cached'] + meminfo['SReclaimable']
+                divisor = _RAM_UNIT_DIVISORS[unit]
+                return RamInfo(
+                    total=total // divisor,
+                    used=(total - available) // divisor,
+                    free=meminfo['MemFree'] // divisor,
+                    cache=cache // divisor,
+                    available=available // divisor,
+                    size=size,
+                )
+            except (IndexError, KeyError, ValueError) as e:
+                self.logger.error("Failed to parse /proc/meminfo: %s", e)
+        return RamInfo(size=size)
+
+    @ttl_cache(seconds=1)
     def get_network_interface_info(self, interface: str='eth0') -> dict[str, str]:
         """Retrieves network interface info. Uses a safer approach.
 
@@ -484,63 +823,79 @@ class RPiSystemInfo(metaclass=Singleton):
         """
         nic_fields = ['mac', 'ip', 'mask', 'broadcast', 'gateway', 'state']
         nic_info = dict.fromkeys(nic_fields, "")
-        try:
-            if interface in os.listdir(self._NET_PATH):
+        if os.path.isdir(os.path.join(self._NET_PATH, interface)):
+            try:
+                mac_addr_output = self.__read_file(f"{self._NET_PATH}/{interface}/address")
+                nic_info['mac'] = mac_addr_output.upper()
+
+                # Virtual interfaces without carrier detection report "unknown" while being usable
+                operstate = self.__read_file(f"{self._NET_PATH}/{interface}/operstate")
+                if operstate not in ('up', 'unknown'):
+                    nic_info['state'] = 'DOWN'
+                    self.logger.warning("Interface %s is DOWN", interface)
+                    return nic_info
+
                 try:
-                    mac_addr_cmd = f"cat /sys/class/net/{interface}/address"
-                    mac_addr_output = self.__get_shell_cmd_output(mac_addr_cmd)
-                    nic_info['mac'] = mac_addr_output.upper()
-
-                    ip_link_cmd = f"ip -o link show {interface}"
-                    ip_link_output = self.__get_shell_cmd_output(ip_link_cmd)
-                    if "state UP" not in ip_link_output and "LOWER_UP" not in ip_link_output:
-                        nic_info['state'] = 'DOWN'
-                        self.logger.warning(f"Interface {interface} is DOWN")
-                        return nic_info
-
-                    ip_addr_cmd = f"ip -4 addr show {interface}"
-                    ip_addr_cmd_output = self.__get_shell_cmd_output(ip_addr_cmd)
-                    if ip_addr_cmd_output:
-                        nic_info['state'] = 'UP'
-                        ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)/(\d+)', ip_addr_cmd_output)
-                        broadcast_match = re.search(r'brd (\d+\.\d+\.\d+\.\d+)', ip_addr_cmd_output)
-                        if not ip_match or not broadcast_match:
-                            self.logger.error(f"Failed to parse '{ip_addr_cmd}' command output: {ip_addr_cmd_output}")
-                        else:
-                            nic_info['ip'] = ip_match.group(1)
-                            prefix_len = int(ip_match.group(2))
-                            nic_info['broadcast'] = broadcast_match.group(1)
-                            mask = (0xffffffff << (32 - prefix_len)) & 0xffffffff
-                            mask_bytes = [
-                                (mask >> 24) & 0xff,
-                                (mask >> 16) & 0xff,
-                                (mask >> 8) & 0xff,
-                                mask & 0xff,
-                            ]
-                            nic_info['mask'] = ".".join(map(str, mask_bytes))
-
-                            ip_route_cmd = f"ip route show | grep ^def.*{interface}"
-                            ip_route_output = self.__get_shell_cmd_output(ip_route_cmd)
-                            gateway_match = re.search(r'^default via (\d+\.\d+\.\d+\.\d+)', ip_route_output)
-                            if gateway_match:
-                                nic_info['gateway'] = gateway_match.group(1)
-                    else:
-                        self.logger.error(f"Empty output for command {ip_addr_cmd}")
-                        return nic_info
-                except Exception as e:
-                    self.logger.error(f"Unexpected error while retrieving interface {interface} information: {e}")
-            else:
-                self.logger.error(f"Incorrect network interface: {interface}")
-        except FileNotFoundError:
-            self.logger.error(f"Can not load network interface info from {self._NET_PATH}")
-        self.logger.debug(f"Network interface {interface} info: {', '.join(f'{k}: {v}' for k, v in nic_info.items())}")
+                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                        nic_info['ip'] = self.__get_interface_ipv4(sock, _SIOCGIFADDR, interface)
+                        nic_info['mask'] = self.__get_interface_ipv4(sock, _SIOCGIFNETMASK, interface)
+                        nic_info['broadcast'] = self.__get_interface_ipv4(sock, _SIOCGIFBRDADDR, interface)
+                except OSError as e:
+                    self.logger.error("Failed to get IPv4 address of interface %s: %s", interface, e)
+                    return nic_info
+                nic_info['state'] = 'UP'
+
+                nic_info['gateway'] = self.__get_default_gateway(interface)
+            except Exception as e:
+                self.logger.error("Unexpected error while retrieving interface %s information: %s", interface, e)
+        else:
+            self.logger.error("Incorrect network interface: %s", interface)
+        self.logger.debug("Network interface %s info: %s",
+                          interface, ', '.join(f'{k}: {v}' for k, v in nic_info.items()))
         return nic_info
 
+    @staticmethod
+    def __get_interface_ipv4(sock: socket.socket, request: int, interface: str) -> str:
+        """Queries an IPv4 address of a network interface from the kernel with an ioctl request.
+
+        Args:
+            sock: An AF_INET socket to issue the request on.
+            request: The ioctl request code (SIOCGIFADDR, SIOCGIFNETMASK or SIOCGIFBRDADDR).
+            interface: The network interface name.
+
+        Returns:
+            The requested address in dotted decimal notation.
+
+        Raises:
+            OSError: If the interface does not exist or has no IPv4 address.
+        """
+        ifreq = struct.pack('256s', interface[:15].encode())
+        # struct ifreq: 16 bytes of interface name, then struct sockaddr_in with the address at offset 4
+        return socket.inet_ntoa(fcntl.ioctl(sock.fileno(), request, ifreq)[20:24])
+
+    def __get_default_gateway(self, interface: str) -> str:
+        """Looks up the default gateway of a network interface in the kernel routing table.
+
+        Args:
+            interface: The network interface name.
+
+        Returns:
+            The default gateway in dotted decimal notation, or empty string if there is none.
+        """
+        # Rows look like "eth0\t00000000\t0101A8C0\t0003\t...", addresses are little-endian hex
+        for line in self.__read_file("/proc/net/route").splitlines()[1:]:
+            fields = line.split()
+            if len(fields) > 2 and fields[0] == interface and fields[1] == '00000000' and fields[2] != '00000000':
+                return socket.inet_ntoa(struct.pack('<I', int(fields[2], 16)))
+        return ''
+
     def get_bluetooth_mac_address(self, interface: str = 'hci0') -> str:
         """Retrieves the MAC address for a specific Bluetooth interface.
 
-        Uses `hcitool dev` to list all Bluetooth controllers and extracts the MAC
-        address for the given interface name.
+        Reads the address of the controller from sysfs when the kernel exposes it there,
+        otherwise uses `hcitool dev` to list all Bluetooth controllers and extracts the MAC
+        address for the given interface name. The address of a controller does not change,
+        so a found address is cached per interface.
 
         Args:
             interface: The Bluetooth interface name (default: 'hci0').
@@ -549,8 +904,28 @@ class RPiSystemInfo(metaclass=Singleton):
             The MAC address in uppercase, or an empty string if the command fails,
             the specified interface is not found, or parsing fails.
         """
-        command = "hcitool dev"
-        output = self.__get_shell_cmd_output(command)
+        mac_address = self._bluetooth_mac_addresses.get(interface)
+        if mac_address is None:
+            mac_address = self.__find_bluetooth_mac_address(interface)
+            # An adapter that is missing now may still be attached later, so only found addresses are kept
+            if mac_address:
+                self._bluetooth_mac_addresses[interface] = mac_address
+        return mac_address
+
+    def __find_bluetooth_mac_address(self, interface: str) -> str:
+        """Looks up the MAC address of a Bluetooth interface in sysfs or in `hcitool dev` output.
+
+        Args:
+            interface: The Bluetooth interface name.
+
+        Returns:
+            The MAC address in uppercase, or an empty string if it cannot be found.
+        """
+        address_path = os.path.join(self._BLUETOOTH_PATH, interface, "address")
+        if os.path.isfile(address_path):
+            return self.__read_file(address_path).upper()
+        command = ["hcitool", "dev"]
+        output = self.__get_cmd_output(command)
         if output:
             try:
                 lines = output.splitlines()[1:]
@@ -558,11 +933,13 @@ class RPiSystemInfo(metaclass=Singleton):
                     parts = line.split()
                     if len(parts) >= 2 and parts[0] == interface:
                         return parts[1].upper()
-                self.logger.error(f"Bluetooth interface '{interface}' not found in output: {output}")
+                self.logger.error("Bluetooth interface '%s' not found in output: %s", interface, output)
             except (IndexError, ValueError) as e:
-                self.logger.error(f"Failed to parse {command} command output: {output} ({e})")
+                self.logger.error("Failed to parse %s command output: %s (%s)", " ".join(command), output, e)
         return ''
 
+    # nmcli may trigger a new scan, which takes noticeably long, and the list changes slowly
+    @ttl_cache(seconds=5)
     def get_available_wifi_networks(self) -> list[dict[str, str]]:
         """Retrieves info about available Wi-Fi networks.
 
@@ -571,32 +948,20 @@ class RPiSystemInfo(metaclass=Singleton):
             Wi-Fi networks in list ordered by SSID.
         """
         networks: list[dict[str, str]] = []
-        command = "nmcli dev wifi list"
-        output = self.__get_shell_cmd_output(command)
-        if output:
-            try:
-                lines = output.splitlines()[1:]
-                if not lines:
-                    self.logger.warning("No Wi-Fi networks information available")
-                    return networks
-                for line in lines:
-                    values = line.split()
-                    if line.startswith('*'):
-                        values = values[1:]
-                    k = values.index("Mbit/s")
-                    networks.append({
-                        'ssid': " ".join(values[1:k-3]),
-                        'bssid': values[0],
-                        'mode': values[k-3],
-                        'channel': values[k-2],
-                        'rate': " ".join(values[k-1:k+1]),
-                        'signal': values[k+1],
-                        'bars': values[k+2],
-                        'security': " ".join(values[k+3:]),
-                    })
-                return networks
-            except Exception as e:
-                self.logger.error(f"Unexpected error while retrieving Wi-Fi networks info: {e}")
+        fields = ['ssid', 'bssid', 'mode', 'channel', 'rate', 'signal', 'bars', 'security']
+        # Terse mode prints one colon-separated line per network without a header
+        output = self.__get_cmd_output(
+            ["nmcli", "-t", "-f", "SSID,BSSID,MODE,CHAN,RATE,SIGNAL,BARS,SECURITY", "dev", "wifi", "list"],
+        )
+        if not output:
+            self.logger.warning("No Wi-Fi networks information available")
+            return networks
+        for line in output.splitlines():
+            values = _split_nmcli_terse(line)
+            if len(values) != len(fields):
+                self.logger.warning("Skipping malformed Wi-Fi network line: %s", line)
+                continue
+            networks.append(dict(zip(fields, values, strict=True)))
         return networks
 
     def get_wifi_network_name(self) -> str:
@@ -606,36 +971,34 @@ class RPiSystemInfo(metaclass=Singleton):
             The Wi-Fi network name, or empty string if unable to obtain.
         """
         try:
-            command = "iwgetid -r"
-            output = self.__get_shell_cmd_output(command)
+            output = self.__get_cmd_output(["iwgetid", "-r"])
             if output is None:
                 return ""
             wifi_name = str(output).strip()
             return wifi_name
         except Exception as e:
-            self.logger.error(f"Failed to get Wi-Fi network name: {e}")
+            self.logger.error("Failed to get Wi-Fi network name: %s", e)
         return ""
 
-    def check_internet_connection(self, test_url: str = "http://www.google.com", timeout: int = 5) -> bool:
-        """Checks for an active internet connection by attempting to make an HTTP request.
+    def check_internet_connection(self, host: str = "1.1.1.1", port: int = 53, timeout: int = 5) -> bool:
+        """Checks for an active internet connection by opening a TCP connection to a well-known host.
 
         Args:
-            test_url: URL to test the connection to. Defaults to "http://www.google.com".
-            timeout: Timeout in seconds to wait for a response.
+            host: Host to test the connection to. Defaults to the "1.1.1.1" public DNS resolver.
+            port: TCP port to connect to. Defaults to 53.
+            timeout: Timeout in seconds to wait for the connection.
         Returns:
             True if there is a connection, False otherwise.
         """
         try:
-            urllib.request.urlopen(test_url, timeout=timeout)
-            self.logger.debug("Internet connection is active.")
-            return True
-        except urllib.error.URLError as e:
-            self.logger.error(f"URLError while checking connection: {e.reason}. " \
-                "Internet connection is missing or blocked.")
+            # A bare TCP handshake is enough to prove connectivity, no request has to be sent
+            with socket.create_connection((host, port), timeout=timeout):
+                self.logger.debug("Internet connection is active.")
+                return True
         except TimeoutError:
             self.logger.error("Connection timeout. Internet may be slow or unavailable.")
-        except Exception as e:
-            self.logger.error(f"Unexpected error while checking connection: {e}.")
+        except OSError as e:
+            self.logger.error("Error while checking connection: %s. Internet connection is missing or blocked.", e)
         return False
 
     def get_public_ip(self, timeout: int = 5) -> str:
@@ -646,27 +1009,31 @@ class RPiSystemInfo(metaclass=Singleton):
         Returns:
             The public IP address as a string, or empty string if unable to obtain.
         """
-        ip_service_urls = [
-            "http://icanhazip.com",
-            "http://api.ipify.org"
-            "http://myexternalip.com/raw",
+        ip_services = [
+            ("icanhazip.com", "/"),
+            ("api.ipify.org", "/"),
+            ("myexternalip.com", "/raw"),
         ]
         public_ip = ''
-        for ip_service_url in ip_service_urls:
-            self.logger.debug(f"Trying to get public IP address via {ip_service_url}...")
+        for host, path in ip_services:
+            self.logger.debug("Trying to get public IP address via %s%s...", host, path)
+            connection = http.client.HTTPConnection(host, timeout=timeout)
             try:
-                response: http.client.HTTPResponse
-                with urllib.request.urlopen(ip_service_url, timeout=timeout) as response:
-                    public_ip = response.read().decode('utf-8').strip()
-                    self.logger.debug(f"Public IP address: {public_ip}")
-                    return public_ip
-            except urllib.error.URLError as e:
-                self.logger.error(f"URLError while getting public IP address: {e.reason}. " \
-                    "Maybe there is no Internet or the service is unavailable.")
+                connection.request("GET", path)
+                response = connection.getresponse()
+                if response.status != http.client.OK:
+                    self.logger.error("Service %s responded with status %s %s.", host, response.status, response.reason)
+                    continue
+                public_ip = response.read().decode('utf-8').strip()
+                self.logger.debug("Public IP address: %s", public_ip)
+                return public_ip
             except TimeoutError:
                 self.logger.error("Timeout while getting public IP address.")
-            except Exception as e:
-                self.logger.error(f"Unexpected error while getting public IP address: {e}.")
+            except (OSError, http.client.HTTPException) as e:
+                self.logger.error("Error while getting public IP address: %s. "
+                    "Maybe there is no Internet or the service is unavailable.", e)
+            finally:
+                connection.close()
         return public_ip
 
     def get_disks_info(self) -> list[dict[str, str]]:
@@ -679,8 +1046,8 @@ class RPiSystemInfo(metaclass=Singleton):
         self.logger.debug("Started get_disks_info")
         headers = ["filesystem", "size", "used", "available", "use_percent", "mounted_on"]
         disks: list[dict[str, str]] = []
-        command = "df -h --output=source,size,used,avail,pcent,target | head -n 1; df -h | tail -n +2 | sort -k6"
-        output = self.__get_shell_cmd_output(command)
+        # Columns are requested explicitly so their order matches headers, the mount point is last
+        output = self.__get_cmd_output(["df", "-h", "--output=source,size,used,avail,pcent,target"])
         if output:
             try:
                 lines = output.splitlines()[1:]
@@ -688,16 +1055,16 @@ class RPiSystemInfo(metaclass=Singleton):
                     self.logger.warning("No disks information available")
                     return disks
                 for line in lines:
-                    values = line.split()
                     values = line.split(maxsplit=5)
                     if len(values) != 6:
                         continue
                     disk_info = dict(zip(headers, values, strict=False))
                     disk_info["use_percent"] = disk_info["use_percent"].replace("%", "")
                     disks.append(disk_info)
+                disks.sort(key=lambda disk: disk["mounted_on"])
                 return disks
             except Exception as e:
-                self.logger.error(f"Unexpected error getting disks info: {e}")
+                self.logger.error("Unexpected error getting disks info: %s", e)
         return disks
 
     def get_disks_inodes_info(self) -> list[dict[str, str]]:
@@ -710,8 +1077,7 @@ class RPiSystemInfo(metaclass=Singleton):
         self.logger.debug("Started get_disks_inodes_info")
         headers = ["filesystem", "inodes", "used", "free", "use_percent", "mounted_on"]
         disks: list[dict[str, str]] = []
-        command = "df -i | head -n 1; df -i | tail -n +2 | sort -k6"
-        output = self.__get_shell_cmd_output(command)
+        output = self.__get_cmd_output(["df", "-i"])
         if output:
             try:
                 lines = output.splitlines()[1:]
@@ -719,56 +1085,77 @@ class RPiSystemInfo(metaclass=Singleton):
                     self.logger.warning("No disks inodes information available")
                     return disks
                 for line in lines:
-                    values = line.split()
                     values = line.split(maxsplit=5)
                     if len(values) != 6:
                         continue
                     disk_info = dict(zip(headers, values, strict=False))
                     disk_info["use_percent"] = disk_info["use_percent"].replace("%", "")
                     disks.append(disk_info)
+                disks.sort(key=lambda disk: disk["mounted_on"])
                 return disks
             except Exception as e:
-                self.logger.error(f"Unexpected error getting disks inodes info: {e}")
+                self.logger.error("Unexpected error getting disks inodes info: %s", e)
         return disks
 
     def get_processes_info(self) -> list[dict[str, Any]]:
-        """Retrieves info about running processes in system.
+        """Retrieves info about running processes in system from /proc.
+
+        CPU and memory usage are computed the same way 'ps' does: CPU time spent over
+        the lifetime of the process and resident set size relative to total memory.
 
         Returns:
-            List of dicts with process info or empty list if error occurs.
-            Each dict contains: user, pid, cpu%, mem%, command, start_time.
+            List of dicts with process info sorted by CPU usage, or empty list if error occurs.
+            Each dict contains: user, pid, cpu_percent, mem_percent, command, started_on.
         """
         self.logger.debug("Started get_processes_info")
         processes: list[dict[str, Any]] = []
-        command = "ps -eo user,pid,pcpu,pmem,comm,lstart --sort=-pcpu"
-        output = self.__get_shell_cmd_output(command)
-        if output:
-            try:
-                lines = output.splitlines()[1:]
-                if not lines:
-                    self.logger.warning("No processes information available")
-                    return processes
-                for line in lines:
+        try:
+            uptime = float(self.__read_polled_file("/proc/uptime").partition(' ')[0])
+            boot_timestamp = self.boot_time.timestamp() if self.boot_time else time.time() - uptime
+            mem_total = self._mem_total
+            users: dict[int, str] = {}
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
                     try:
-                        parts = line.split()
-                        process_info = {
-                            'user': parts[0],
-                            'pid': parts[1],
-                            'cpu_percent': float(parts[2]),
-                            'mem_percent': float(parts[3]),
-                            'command': " ".join(parts[4:-5]),
-                            'started_on': datetime.strptime(" ".join(parts[-5:]), "%a %b %d %H:%M:%S %Y"),
-                        }
-                        if process_info['command'] != 'ps':
-                            processes.append(process_info)
-                    except (ValueError, IndexError) as e:
-                        self.logger.warning(f"Skipping malformed process line: {line} ({e})")
+                        with open(f"/proc/{entry.name}/stat", 'rb') as stat_file:
+                            stat = stat_file.read()
+                        uid = entry.stat().st_uid
+                    except OSError:
+                        # The process has exited since the directory was listed
                         continue
-                return processes
-            except Exception as e:
-                self.logger.error(f"Unexpected error getting process info: {e}")
+                    # The command is in parentheses and may contain spaces and parentheses itself
+                    command_end = stat.rfind(b')')
+                    fields = stat[command_end + 2:].split()
+                    if stat.find(b'(') < 0 or len(fields) < 22:
+                        self.logger.warning("Skipping malformed process stat: %s", stat)
+                        continue
+                    # fields[0] is the 3rd field of stat (state), see proc_pid_stat(5)
+                    cpu_time = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+                    start_time = int(fields[19]) / _CLK_TCK
+                    elapsed = uptime - start_time
+                    if uid not in users:
+                        try:
+                            users[uid] = pwd.getpwuid(uid).pw_name
+                        except KeyError:
+                            users[uid] = str(uid)
+                    processes.append({
+                        'user': users[uid],
+                        'pid': entry.name,
+                        'cpu_percent': round(100 * cpu_time / elapsed, 1) if elapsed > 0 else 0.0,
+                        'mem_percent': round(100 * int(fields[21]) * _PAGE_SIZE / mem_total, 1) if mem_total else 0.0,
+                        'command': stat[stat.find(b'(') + 1:command_end].decode(errors='replace'),
+                        'started_on': datetime.fromtimestamp(int(boot_timestamp + start_time)),
+                    })
+            if not processes:
+                self.logger.warning("No processes information available")
+            processes.sort(key=lambda process: process['cpu_percent'], reverse=True)
+        except Exception as e:
+            self.logger.error("Unexpected error getting process info: %s", e)
         return processes
 
+    @ttl_cache(seconds=1)
     def get_throttled_state(self) -> dict[str, Any] | None:
         """
         Retrieves the throttled status of the Raspberry Pi processor.
@@ -779,39 +1166,22 @@ class RPiSystemInfo(metaclass=Singleton):
             arm_frequency_capped_occurred, throttling_occurred, soft_temperature_limit_occurred)
             and text description.
         """
-        command = "vcgencmd get_throttled | cut -d= -f2"
-        throttled = self.__get_shell_cmd_output(command).strip('"')
+        # Output looks like "throttled=0x50000"
+        throttled = self.__get_vcgencmd_output("get_throttled").partition('=')[2]
         try:
             throttled_int = int(throttled, 16)
-            status = {
-                "raw_value": throttled_int,
-                "description": "",
-                "under_voltage": bool(throttled_int & 0x1),
-                "arm_frequency_capped": bool(throttled_int & 0x2),
-                "currently_throttled": bool(throttled_int & 0x4),
-                "soft_temperature_limit": bool(throttled_int & 0x8),
-                "under_voltage_occurred": bool(throttled_int & 0x10000),
-                "arm_frequency_capped_occurred": bool(throttled_int & 0x20000),
-                "throttling_occurred": bool(throttled_int & 0x40000),
-                "soft_temperature_limit_occurred": bool(throttled_int & 0x80000),
-            }
+            status: dict[str, Any] = {"raw_value": throttled_int, "description": ""}
             descriptions = []
-            if status["under_voltage"]:
-                descriptions.append("Undervoltage detected")
-            if status["arm_frequency_capped"]:
-                descriptions.append("Arm frequency capped")
-            if status["currently_throttled"]:
-                descriptions.append("Currently throttled")
-            if status["soft_temperature_limit"]:
-                descriptions.append("Soft temperature limit active")
-            if not descriptions:
-                descriptions.append("No active issues")
-            status["description"] = '; '.join(descriptions)
+            for name, mask, description in _THROTTLE_BITS:
+                status[name] = bool(throttled_int & mask)
+                if description and status[name]:
+                    descriptions.append(description)
+            status["description"] = '; '.join(descriptions) or "No active issues"
             return status
         except ValueError as e:
-            self.logger.error(f"Error while converting throttled value {throttled} to int: {e}")
+            self.logger.error("Error while converting throttled value %s to int: %s", throttled, e)
         except Exception as e:
-            self.logger.error(f"Failed to read throttled status: {e}")
+            self.logger.error("Failed to read throttled status: %s", e)
         return None
 
     def get_sd_card_info(self) -> list[dict[str, str | None]]:
@@ -938,49 +1308,67 @@ class RPiSystemInfo(metaclass=Singleton):
 
 
 def main() -> None:
-    LoggerSingleton(level="INFO", colored=True)
+    LoggerSingleton(level="INFO", colored=True, trim_record_fields=True)
     logger = LoggerSingleton.get_logger()
     rpi_info = RPiSystemInfo(logger)
     try:
-        logger.info(f"Model: {rpi_info.model_name}")
-        logger.info(f"Revision: {rpi_info.revision}")
-        logger.info(f"Serial number: {rpi_info.serial_number}")
-        logger.info(f"Manufacturer: {rpi_info.manufacturer}")
-        logger.info(f"OS: {rpi_info.os_name}")
-        throttled_state = rpi_info.get_throttled_state()
+        rpi_info.prefetch()
+        interfaces = ['eth0', 'wlan0']
+        # The startup probes are independent and mostly wait on subprocesses and the network,
+        # so they run concurrently and the results are logged in order afterwards
+        with ThreadPoolExecutor(max_workers=6, thread_name_prefix='probe') as executor:
+            throttled_future = executor.submit(rpi_info.get_throttled_state)
+            nic_futures = [executor.submit(rpi_info.get_network_interface_info, interface) for interface in interfaces]
+            wifi_future = executor.submit(rpi_info.get_wifi_network_name)
+            connection_future = executor.submit(rpi_info.check_internet_connection)
+            public_ip_future = executor.submit(rpi_info.get_public_ip)
+        logger.info("Model: %s", rpi_info.model_name)
+        logger.info("Revision: %s", rpi_info.revision)
+        logger.info("Serial number: %s", rpi_info.serial_number)
+        logger.info("Manufacturer: %s", rpi_info.manufacturer)
+        logger.info("OS: %s", rpi_info.os_name)
+        throttled_state = throttled_future.result()
         if throttled_state:
-            logger.info(f"Throttled state: {throttled_state.get('description', 'Unknown')}")
-        for interface in ['eth0', 'wlan0']:
-            nic_info = rpi_info.get_network_interface_info(interface)
+            logger.info("Throttled state: %s", throttled_state.get('description', 'Unknown'))
+        for interface, nic_future in zip(interfaces, nic_futures, strict=True):
+            nic_info = nic_future.result()
             mac_address = nic_info['mac'] or 'Unknown'
             ip_address = nic_info['ip'] or 'Not connected'
             mask = nic_info['mask'] or 'Not connected'
             default_gateway = nic_info['gateway'] or 'Not connected'
-            logger.info(f"{interface} interface: MAC address {mac_address}, IP address {ip_address}, " \
-                    f"Subnet mask: {mask}, Default gateway: {default_gateway}")
-        wifi_network_name = rpi_info.get_wifi_network_name() or 'Not connected'
-        logger.info(f"Wi-Fi network name: {wifi_network_name}")
-        if rpi_info.check_internet_connection():
-            logger.info(f"Internet connection is active, public IP address: {rpi_info.get_public_ip()}")
+            logger.info("%s interface: MAC address %s, IP address %s, Subnet mask: %s, Default gateway: %s",
+                    interface, mac_address, ip_address, mask, default_gateway)
+        wifi_network_name = wifi_future.result() or 'Not connected'
+        logger.info("Wi-Fi network name: %s", wifi_network_name)
+        if connection_future.result():
+            logger.info("Internet connection is active, public IP address: %s", public_ip_future.result())
         else:
             logger.info("Internet connection is not active")
+        ticks = periodic_ticks(2)
+        failures = 0
         while True:
             try:
                 cpu_temp = rpi_info.get_cpu_temperature()
                 cpu_freq = rpi_info.get_cpu_core_frequencies()
                 cpu_usage = rpi_info.get_cpu_usage()
                 ram_info = rpi_info.get_ram_info()
-                logger.info(f"CPU: temperature {cpu_temp} \xb0C, frequency {cpu_freq['cur']} MHz, usage {cpu_usage}%")
-                logger.info(f"RAM: total {ram_info['total']} Mb, used {ram_info['used']} Mb, " \
-                        f"free {ram_info['free']} Mb, cache {ram_info['cache']} Mb, " \
-                        f"available {ram_info['available']} Mb")
+                logger.info("CPU: temperature %s \xb0C, frequency %s MHz, usage %s%%",
+                        cpu_temp, cpu_freq['cur'], cpu_usage)
+                logger.info("RAM: total %s Mb, used %s Mb, free %s Mb, cache %s Mb, available %s Mb",
+                        ram_info.total, ram_info.used, ram_info.free, ram_info.cache, ram_info.available)
+                failures = 0
             except Exception as e:
-                logger.error(f"Error during system info retrieval: {e}")
-            time.sleep(2)
+                failures += 1
+                logger.error("Error during system info retrieval: %s", e)
+            if failures:
+                # Back off exponentially while retrieval keeps failing, the ticker skips the missed ticks afterwards
+                time.sleep(min(30, 2 * 2 ** failures))
+            else:
+                next(ticks)
     except KeyboardInterrupt:
         logger.info("Stopped by user")
     except Exception as e:
-        logger.error(f"Unhandled exception in main loop: {e}")
+        logger.error("Unhandled exception in main loop: %s", e)
 
 
 if __name__ == "__main__":
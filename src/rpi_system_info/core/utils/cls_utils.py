@@ -1,25 +1,56 @@
-from threading import RLock
+from collections.abc import Mapping
+from threading import Lock
+from types import MappingProxyType
 from typing import Any, ClassVar, TypeVar, cast
 
 T = TypeVar('T')
 
 
 class Singleton(type):
-    _instances: ClassVar[dict[type[Any], Any]] = {}
-    _lock: ClassVar[RLock] = RLock()
+    """
+    Metaclass that creates at most one instance per class.
+
+    The first call builds the instance as usual, including `__init__` and, for
+    dataclasses, `__post_init__`. Later calls return the cached instance right
+    away without running any initialization code again, unless the class sets
+    `_allow_reinitialization = True`, in which case `__init__` is re-run with the
+    new arguments. Expensive setup done at construction therefore runs once per
+    process.
+    """
+    # Read-only view, replaced as a whole whenever a new instance is published
+    _instances: ClassVar[Mapping[type[Any], Any]] = MappingProxyType({})
+    # Serializes publishers of different classes, each of them holds only its own class lock
+    _publish_lock: ClassVar[Lock] = Lock()
+    _singleton_lock: Lock
+    _singleton_reinit: bool
+
+    def __init__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]) -> None:
+        super().__init__(name, bases, namespace)
+        # Each class gets its own lock, so unrelated singletons can be built in parallel
+        cls._singleton_lock = Lock()
+        # Resolve the reinitialization flag once instead of probing it on every call
+        cls._singleton_reinit = bool(getattr(cls, '_allow_reinitialization', False))
 
     def __call__(cls: type[T], *args: Any, **kwargs: Any) -> T:
-        singleton_cls = cast(Singleton, cls.__class__)
-        with singleton_cls._lock:
-            if cls not in singleton_cls._instances:
-                # Build the first instance of the class
-                instance = super(Singleton, singleton_cls).__call__(cls, *args, **kwargs)
-                singleton_cls._instances[cls] = instance
-            else:
-                # An instance of the class already exists
-                instance = singleton_cls._instances[cls]
-                # Here we are going to call the __init__ and maybe reinitialize
-                if getattr(cls, '__allow_reinitialization', False):
-                    # If the class allows reinitialization, then do it
-                    instance.__init__(*args, **kwargs)
+        lock = cast(Singleton, cls)._singleton_lock
+        reinit = cast(Singleton, cls)._singleton_reinit
+        # Fast path: the instance is already cached, no locking required
+        instance = Singleton._instances.get(cls)
+        if instance is None:
+            with lock:
+                # Check again, another thread may have built the instance while we were waiting
+                instance = Singleton._instances.get(cls)
+                if instance is None:
+                    # Build the first instance of the class
+                    instance = super(Singleton, cast(Singleton, cls.__class__)).__call__(cls, *args, **kwargs)
+                    # Publish a new mapping instead of mutating the one readers may be looking at
+                    with Singleton._publish_lock:
+                        Singleton._instances = MappingProxyType({**Singleton._instances, cls: instance})
+                    return cast(T, instance)
+        # An instance of the class already exists
+        # Here we are going to call the __init__ and maybe reinitialize
+        if reinit:
+            # If the class allows reinitialization, then do it
+            with lock:
+                instance.__init__(*args, **kwargs)
         return cast(T, instance)
@@ -1,13 +1,104 @@
-from datetime import datetime
+import functools
 import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from datetime import datetime
+from typing import ParamSpec, TypeVar
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec('P')
+R = TypeVar('R')
+
 
 def format_datetime(dt: datetime, fmt: str) -> str:
     """Format datetime with error handling."""
     try:
         return dt.strftime(fmt)
     except (ValueError, TypeError) as e:
-        logger.warning(f"Error formatting datetime {dt}: {e}")
+        logger.warning("Error formatting datetime %s: %s", dt, e)
         return dt.isoformat()
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache function results for a limited time.
+
+    Calls with the same (hashable) arguments made within `seconds` after the result
+    was computed return the cached value instead of calling the function again.
+    Meant for sensor readings that several consumers query back-to-back.
+
+    Every caller gets the same cached object, so results must be treated as read-only;
+    mutating a returned dict or list changes it for all callers until it expires.
+    Concurrent calls for a key that is not cached wait for a single call of the function.
+
+    Args:
+        seconds (float): How long a computed result is reused.
+
+    Returns:
+        Callable: Decorator applying the cache to a function.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        cache: dict[Hashable, tuple[float, R]] = {}
+        key_locks: dict[Hashable, threading.Lock] = {}
+        key_locks_guard = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            with key_locks_guard:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # Another thread may have computed the result while this one waited
+                entry = cache.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1]
+                result = func(*args, **kwargs)
+                # Count the lifetime from when the result became available, slow calls should still be reused
+                cache[key] = (time.monotonic() + seconds, result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def periodic_ticks(interval: float) -> Iterator[int]:
+    """Wait for the ticks of a fixed cadence that does not drift with the work done between them.
+
+    On Python 3.13+ the cadence is kept by a timerfd, so each wait is a single blocking read.
+    Older versions sleep until the next deadline on the monotonic clock.
+
+    Args:
+        interval (float): Period between ticks in seconds.
+
+    Yields:
+        int: Number of periods elapsed since the previous tick, more than 1 means ticks were missed.
+    """
+    if sys.version_info >= (3, 13):
+        fd = os.timerfd_create(time.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC)
+        try:
+            os.timerfd_settime(fd, initial=interval, interval=interval)
+            while True:
+                # The timer counts expirations since the last read in a native-endian uint64
+                yield int.from_bytes(os.read(fd, 8), sys.byteorder)
+        finally:
+            os.close(fd)
+    else:
+        deadline = time.monotonic()
+        while True:
+            deadline += interval
+            delay = deadline - time.monotonic()
+            missed = 0
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Skip the deadlines that already passed instead of firing them back-to-back
+                missed = int(-delay // interval)
+                deadline += missed * interval
+            yield missed + 1
@@ -1,5 +1,11 @@
+import atexit
+import functools
 import logging
 import logging.handlers
+import os
+import queue
+import sys
+import threading
 from logging import Logger, LogRecord
 from pathlib import Path
 from typing import Any, ClassVar, TypedDict
@@ -8,6 +14,25 @@ from colorama import Fore, Style
 
 from .cls_utils import Singleton
 
+_MB = 1 << 20
+# Most buffers a single writev() call accepts on Linux
+_IOV_MAX = 1024
+
+
+@functools.cache
+def _colored_formats(fmt: str | None, level_colors: tuple[tuple[int, str], ...]) -> tuple[tuple[int, str], ...]:
+    """
+    Wrap a message format in the color codes of every level.
+
+    Args:
+        fmt (str | None): Log message format string.
+        level_colors (tuple[tuple[int, str], ...]): Pairs of log level number and ANSI color code.
+
+    Returns:
+        tuple[tuple[int, str], ...]: Pairs of log level number and colored format string.
+    """
+    return tuple((level, f"{color}{fmt}{Style.RESET_ALL}") for level, color in level_colors)
+
 
 class CustomColoredFormatter(logging.Formatter):
     """
@@ -46,14 +71,20 @@ class CustomColoredFormatter(logging.Formatter):
         self.datefmt = datefmt
         super().__init__(fmt=fmt, datefmt=datefmt)
 
+        level_colors = dict(self.LEVEL_COLORS)
         if colors:
-            self.LEVEL_COLORS.update(
+            level_colors.update(
                 {
                     getattr(logging, k.upper()): v
                     for k, v in colors.items()
                     if k.upper() in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
                 },
             )
+        # Build one formatter per level up front instead of a new one for every record
+        self._formatters: dict[int, logging.Formatter] = {
+            level: logging.Formatter(fmt=colored_fmt, datefmt=datefmt)
+            for level, colored_fmt in _colored_formats(self._fmt, tuple(level_colors.items()))
+        }
 
     def format(self, record: LogRecord) -> str:
         """
@@ -65,13 +96,167 @@ class CustomColoredFormatter(logging.Formatter):
         Returns:
             str: The formatted log message with ANSI color codes.
         """
-        log_fmt = self.fmt
-        if record.levelno in self.LEVEL_COLORS:
-            log_fmt = f"{self.LEVEL_COLORS[record.levelno]}{self.fmt}{Style.RESET_ALL}"
-        formatter = logging.Formatter(fmt=log_fmt, datefmt=self.datefmt)
+        formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes encoded records to an append-only file descriptor.
+
+    Every record is encoded once and kept in an in-memory buffer, which is written to
+    the file when a record of `flush_level` or higher is emitted, when the handler is
+    closed, and at most `flush_interval` seconds after the first unflushed record.
+    The file is opened with O_APPEND and all buffered records are written with one
+    `os.writev` call, bypassing the text stream of the base class. The rollover check
+    uses an internal counter of written bytes instead of `tell()`.
+    """
+
+    def __init__(
+            self,
+            filename: Path | str,
+            max_bytes: int = 0,
+            backup_count: int = 0,
+            encoding: str | None = None,
+            flush_level: int = logging.WARNING,
+            flush_interval: float = 0.1,
+    ) -> None:
+        """
+        Initialize the buffered rotating file handler.
+
+        Args:
+            filename (Path | str): Path to the log file.
+            max_bytes (int): Maximum file size in bytes before rollover (0 disables rollover).
+            backup_count (int): Number of archived log files to keep.
+            encoding (str | None): File encoding (default 'utf-8').
+            flush_level (int): Records of this level or higher are flushed immediately.
+            flush_interval (float): Maximum delay in seconds before buffered records are flushed.
+        """
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._flush_timer: threading.Timer | None = None
+        self._pending: list[bytes] = []
+        self._fd: int | None = None
+        self._written = 0
+        # The text stream of the base class is never opened, records go through self._fd
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self._byte_encoding = encoding or "utf-8"
+        self._open_fd()
+
+    def _open_fd(self) -> None:
+        """Open the log file for appending and initialize the written bytes counter."""
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._written = os.fstat(self._fd).st_size
+
+    def _close_fd(self) -> None:
+        """Close the log file descriptor, if it is open."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write_pending(self) -> None:
+        """
+        Write the buffered records to the file with as few system calls as possible.
+
+        Records are removed from the buffer only once they have been written, so after
+        a failed write (e.g. a full disk) the unwritten records are kept for the next flush.
+
+        Raises:
+            OSError: If writing to the file fails.
+        """
+        fd = self._fd
+        if fd is None:
+            return
+        while self._pending:
+            chunk = self._pending[:_IOV_MAX]
+            written = os.writev(fd, chunk) if hasattr(os, "writev") else os.write(fd, b"".join(chunk))
+            # A short write leaves the rest of the chunk in the buffer for the next iteration
+            self._drop_written(written)
+
+    def _drop_written(self, count: int) -> None:
+        """
+        Remove the given number of written bytes from the start of the buffer.
+
+        Args:
+            count (int): Number of bytes written to the file.
+        """
+        pending = self._pending
+        done = 0
+        while done < len(pending) and count >= len(pending[done]):
+            count -= len(pending[done])
+            done += 1
+        del pending[:done]
+        if count:
+            pending[0] = pending[0][count:]
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Buffer the encoded record, rolling the file over first if needed.
+
+        Args:
+            record (LogRecord): The log record to write.
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode(self._byte_encoding)
+            if 0 < self.maxBytes <= self._written + len(data) and self._written > 0:
+                self.doRollover()
+            if self._fd is None:
+                self._open_fd()
+            self._pending.append(data)
+            self._written += len(data)
+            if record.levelno >= self.flush_level:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Write out buffered records, roll the file over and reopen it."""
+        self._write_pending()
+        self._close_fd()
+        super().doRollover()
+        self._open_fd()
+
+    def flush(self) -> None:
+        """Write buffered records to the file and cancel the pending flush timer."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._write_pending()
+        finally:
+            self.release()
+
+    def _timed_flush(self) -> None:
+        """Flush from the timer thread, reporting write errors on stderr instead of raising them."""
+        try:
+            self.flush()
+        except OSError as e:
+            # Same policy as Handler.handleError, which needs a record to report
+            if logging.raiseExceptions and sys.stderr:
+                sys.stderr.write(f"--- Logging error ---\nFailed to write log records to {self.baseFilename}: {e}\n")
+
+    def close(self) -> None:
+        """Write buffered records and close the file descriptor, even if the final write fails."""
+        self.acquire()
+        try:
+            self.flush()
+        finally:
+            try:
+                self._close_fd()
+            finally:
+                self.release()
+                super().close()
+
+
 class LoggerConfig(TypedDict, total=False):
     log_dir: Path | str | None
     log_file: str | None
@@ -85,6 +270,7 @@ class LoggerConfig(TypedDict, total=False):
     encoding: str
     file_msg_format: str | None
     file_date_format: str | None
+    trim_record_fields: bool
     kwargs: dict[str, Any]
 
 
@@ -94,16 +280,22 @@ class LoggerSingleton(metaclass=Singleton):
 
     The logger is configured upon first instantiation. Subsequent calls to the
     constructor return the same instance. If the class attribute
-    `__allow_reinitialization` is set to True, re-initialization is permitted.
+    `_allow_reinitialization` is set to True, re-initialization is permitted.
+
+    The logger itself only has a QueueHandler attached: records are put on a queue
+    and the console and file handlers run in a background QueueListener thread, so
+    logging calls do not block on I/O.
 
     Class Attributes:
-        __logger (Logger): The internal logger instance.
-        __allow_reinitialization (bool): Whether to allow re-initialization.
+        _logger (Logger): The internal logger instance.
+        _listener (QueueListener | None): Background listener serving the real handlers.
+        _allow_reinitialization (bool): Whether to allow re-initialization.
         DEFAULT_FORMAT (str): Default log message format.
         DEFAULT_DATE_FORMAT (str): Default date/time format.
     """
-    __logger: Logger = logging.getLogger('SuperLogger')
-    __allow_reinitialization: bool = False
+    _logger: Logger = logging.getLogger('SuperLogger')
+    _listener: logging.handlers.QueueListener | None = None
+    _allow_reinitialization: bool = False
     _initialized: bool = False
     _config: LoggerConfig = {}
 
@@ -124,12 +316,13 @@ class LoggerSingleton(metaclass=Singleton):
         encoding: str = "utf-8",
         file_msg_format: str | None = None,
         file_date_format: str | None = None,
+        trim_record_fields: bool = False,
         **kwargs: Any,
     ) -> None:
         """
         Initialize (or re-initialize) the logger.
 
-        If an instance already exists and `__allow_reinitialization` is False,
+        If an instance already exists and `_allow_reinitialization` is False,
         the constructor does nothing.
 
         Args:
@@ -145,9 +338,12 @@ class LoggerSingleton(metaclass=Singleton):
             encoding (str): File encoding (default 'utf-8').
             file_msg_format (str | None): Separate format for file handler (uses msg_format if None).
             file_date_format (str | None): Separate date format for file handler (uses date_format if None).
+            trim_record_fields (bool): Skip collecting thread and process data for log records
+                when none of the formats reference it. These switches are global to the logging
+                module, so only enable this when no other logger in the process needs that data.
             **kwargs: Additional arguments passed to the formatter.
         """
-        if not type(self)._initialized or type(self).__allow_reinitialization:
+        if not type(self)._initialized or type(self)._allow_reinitialization:
             self._initialize_logger(
                 log_dir=log_dir,
                 log_file=log_file,
@@ -161,6 +357,7 @@ class LoggerSingleton(metaclass=Singleton):
                 encoding=encoding,
                 file_msg_format=file_msg_format,
                 file_date_format=file_date_format,
+                trim_record_fields=trim_record_fields,
                 **kwargs,
             )
             type(self)._initialized = True
@@ -179,10 +376,12 @@ class LoggerSingleton(metaclass=Singleton):
         encoding: str = "utf-8",
         file_msg_format: str | None = None,
         file_date_format: str | None = None,
+        trim_record_fields: bool = False,
         **kwargs: Any,
     ) -> None:
         """
-        Configure the logger handlers. Clears any existing handlers.
+        Configure the logger handlers. Stops the running queue listener and
+        clears any existing handlers.
 
         Args:
             log_dir (Path | str | None): Directory for log files (converted to Path if string).
@@ -197,16 +396,25 @@ class LoggerSingleton(metaclass=Singleton):
             encoding (str): File encoding.
             file_msg_format (str | None): Format for file handler (uses msg_format if None).
             file_date_format (str | None): Date format for file handler (uses date_format if None).
+            trim_record_fields (bool): Skip collecting record fields that no format references.
             **kwargs: Additional arguments for the formatter.
         """
-        if log_dir is not None and not isinstance(log_dir, Path):
-            log_dir = Path(log_dir)
+        # Convert once; an empty string means no file logging, same as None
+        log_dir = Path(log_dir) if log_dir else None
 
-        self.__class__.__logger.setLevel(level)
-        self.__class__.__logger.handlers.clear()
+        self._stop_queue_listener()
+        logger = self._logger
+        logger.setLevel(level)
+        # Resolve the level name once, the handlers reuse the numeric value
+        level_no = logger.level
+        # Records are fully handled here, do not pass them on to the root logger's handlers
+        logger.propagate = False
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
 
         self._add_stream_handler(
-            level=level,
+            level=level_no,
             msg_format=msg_format,
             date_format=date_format,
             colored=colored,
@@ -218,7 +426,7 @@ class LoggerSingleton(metaclass=Singleton):
             self._add_file_handler(
                 log_dir=log_dir,
                 log_file=log_file,
-                level=level,
+                level=level_no,
                 msg_format=file_msg_format or msg_format,
                 date_format=file_date_format or date_format,
                 max_size_mb=max_size_mb,
@@ -226,6 +434,11 @@ class LoggerSingleton(metaclass=Singleton):
                 encoding=encoding,
             )
 
+        if trim_record_fields:
+            self._trim_record_fields(msg_format, file_msg_format or msg_format)
+
+        self._start_queue_listener(level_no)
+
         # Store current configuration for later updates
         self._config = {
             "log_dir": log_dir,
@@ -240,13 +453,30 @@ class LoggerSingleton(metaclass=Singleton):
             "encoding": encoding,
             "file_msg_format": file_msg_format,
             "file_date_format": file_date_format,
+            "trim_record_fields": trim_record_fields,
             "kwargs": kwargs,
         }
 
 
+    @staticmethod
+    def _trim_record_fields(*formats: str) -> None:
+        """
+        Stop LogRecord from looking up the current thread, process and asyncio task
+        on every call when none of the given formats uses them.
+
+        Args:
+            *formats (str): Message formats in use by the handlers.
+        """
+        used = " ".join(formats)
+        logging.logThreads = "%(thread" in used
+        logging.logProcesses = "%(process)" in used
+        logging.logMultiprocessing = "%(processName)" in used
+        if sys.version_info >= (3, 12):
+            logging.logAsyncioTasks = "%(taskName)" in used
+
     def _add_stream_handler(
         self,
-        level: str,
+        level: int,
         msg_format: str,
         date_format: str,
         colored: bool,
@@ -257,28 +487,30 @@ class LoggerSingleton(metaclass=Singleton):
         Add a console (stdout) handler.
 
         Args:
-            level (str): Logging level.
+            level (int): Numeric logging level.
             msg_format (str): Message format.
             date_format (str): Date format.
-            colored (bool): Enable colors.
+            colored (bool): Enable colors. Ignored when the stream is not a terminal
+                or the NO_COLOR environment variable is set.
             colors (dict[str, str] | None): Custom color mapping.
             **kwargs: Additional arguments for the formatter.
         """
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(level)
+        use_color = colored and stream_handler.stream.isatty() and not os.environ.get("NO_COLOR")
         formatter = (
             CustomColoredFormatter(fmt=msg_format, datefmt=date_format, colors=colors, **kwargs)
-            if colored
+            if use_color
             else logging.Formatter(fmt=msg_format, datefmt=date_format)
         )
         stream_handler.setFormatter(formatter)
-        self.__class__.__logger.addHandler(stream_handler)
+        self._logger.addHandler(stream_handler)
 
     def _add_file_handler(
         self,
         log_dir: Path,
         log_file: str,
-        level: str,
+        level: int,
         msg_format: str,
         date_format: str,
         max_size_mb: int,
@@ -286,12 +518,12 @@ class LoggerSingleton(metaclass=Singleton):
         encoding: str = "utf-8",
     ) -> None:
         """
-        Add a rotating file handler.
+        Add a buffered rotating file handler.
 
         Args:
             log_dir (Path): Directory for the log file (created if it does not exist).
             log_file (str): Log file name.
-            level (str): Logging level.
+            level (int): Numeric logging level.
             msg_format (str): Message format.
             date_format (str): Date format.
             max_size_mb (int): Maximum file size in MB.
@@ -305,21 +537,59 @@ class LoggerSingleton(metaclass=Singleton):
             log_dir.mkdir(parents=True, exist_ok=True)
             file_path = log_dir / log_file
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 file_path,
-                maxBytes=max_size_mb * 1024 * 1024,
-                backupCount=keep,
+                max_bytes=max_size_mb * _MB,
+                backup_count=keep,
                 encoding=encoding,
             )
             file_handler.setLevel(level)
             file_handler.setFormatter(
                 logging.Formatter(fmt=msg_format, datefmt=date_format),
             )
-            self.__class__.__logger.addHandler(file_handler)
+            self._logger.addHandler(file_handler)
         except OSError as e:
-            self.__logger.error(f"Failed to initialize file handler: {e}", exc_info=True)
+            self._logger.error("Failed to initialize file handler: %s", e, exc_info=True)
             raise
 
+    def _start_queue_listener(self, level: int) -> None:
+        """
+        Move the configured handlers behind a queue served by a background thread.
+
+        The logger keeps a single QueueHandler, so callers only pay for enqueuing
+        the record, while formatting and I/O happen in the listener thread.
+
+        Args:
+            level (int): Numeric logging level for the queue handler.
+        """
+        logger = self._logger
+        log_queue: queue.SimpleQueue[LogRecord] = queue.SimpleQueue()
+        handlers = tuple(logger.handlers)
+        logger.handlers.clear()
+
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
+
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        type(self)._listener = listener
+        atexit.unregister(type(self)._stop_queue_listener)
+        atexit.register(type(self)._stop_queue_listener)
+
+    @classmethod
+    def _stop_queue_listener(cls) -> None:
+        """
+        Stop the background listener, if any, after it has processed all queued records,
+        and close the handlers it was serving.
+        """
+        listener = cls._listener
+        if listener is not None:
+            cls._listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
     @classmethod
     def get_logger(cls) -> Logger:
         """
@@ -330,15 +600,10 @@ class LoggerSingleton(metaclass=Singleton):
 
         Returns:
             Logger: The internal logger object.
-
-        Raises:
-            RuntimeError: If the logger is not a valid Logger instance.
         """
         if not cls._initialized:
             cls()
-        if not isinstance(cls.__logger, Logger):
-            raise RuntimeError("Logger was not properly initialized")
-        return cls.__logger
+        return cls._logger
 
     @classmethod
     def update_config(
@@ -355,6 +620,7 @@ class LoggerSingleton(metaclass=Singleton):
         encoding: str | None = None,
         file_msg_format: str | None = None,
         file_date_format: str | None = None,
+        trim_record_fields: bool | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -378,15 +644,14 @@ class LoggerSingleton(metaclass=Singleton):
             encoding (str | None): File encoding.
             file_msg_format (str | None): Separate format for file handler.
             file_date_format (str | None): Separate date format for file handler.
+            trim_record_fields (bool | None): Skip collecting record fields that no format references.
             **kwargs: Additional arguments for the formatter.
 
         Note:
-            This method is thread-safe due to the singleton lock.
+            This method is thread-safe due to the per-class singleton lock.
         """
-        if not cls._initialized:
-            cls()
-
-        config = cls()._config
+        instance = cls()
+        config = instance._config
         new_config: LoggerConfig = {
             "log_dir": log_dir if log_dir is not None else config.get("log_dir"),
             "log_file": log_file if log_file is not None else config.get("log_file"),
@@ -400,22 +665,30 @@ class LoggerSingleton(metaclass=Singleton):
             "encoding": encoding if encoding is not None else config.get("encoding", "utf-8"),
             "file_msg_format": file_msg_format if file_msg_format is not None else config.get("file_msg_format"),
             "file_date_format": file_date_format if file_date_format is not None else config.get("file_date_format"),
+            "trim_record_fields": (
+                trim_record_fields if trim_record_fields is not None else config.get("trim_record_fields", False)
+            ),
             "kwargs": kwargs if kwargs else config.get("kwargs", {}),
         }
 
         # Re-initialize with the merged configuration
-        with Singleton._lock:
-            cls()._initialize_logger(**new_config)
+        with cls._singleton_lock:
+            instance._initialize_logger(**new_config)
 
     @classmethod
     def set_level(cls, level: str) -> None:
         """
-        Change the logging level for the logger and all its handlers.
+        Change the logging level for the logger and all its handlers,
+        including the ones served by the queue listener.
 
         Args:
             level (str): The new logging level (e.g., 'DEBUG').
         """
         logger = cls.get_logger()
         logger.setLevel(level)
-        for handler in logger.handlers:
-            handler.setLevel(level)
+        level_no = logger.level
+        handlers = list(logger.handlers)
+        if cls._listener is not None:
+            handlers.extend(cls._listener.handlers)
+        for handler in handlers:
+            handler.setLevel(level_no)
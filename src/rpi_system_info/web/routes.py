@@ -30,7 +30,7 @@ def register(app: Flask, rpi_info: RPiSystemInfo, cache: Cache, logger: Logger,
     @app.route('/partial/<section>')
     @cache.cached(timeout=config.INDEX_PAGE_CACHE_TIMEOUT)
     def partial_section(section: str) -> str:
-        logger.info(f'Requested {section} tab')
+        logger.info("Requested %s tab", section)
         data: dict[str, Any]
         if section == 'generic':
             data = get_generic_data(rpi_info, config)